@@ -1,35 +1,15 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import csv
+from backend.search_page import parse_search_page
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Accept-Language": "en-US,en;q=0.9",
 }
 
-def get_product_links(soup):
-    products = []
-    for div in soup.select('div.s-result-item[data-asin]'):
-        asin = div.get('data-asin')
-        a = div.select_one('a[href*="/dp/"]')
-        if not a:
-            continue
-        href = a.get('href')
-        url = href.split('?')[0]
-        if not url.startswith('http'):
-            url = 'https://www.amazon.com' + url
-        products.append({
-            'asin': asin,
-            'url': url,
-        })
-    return products
-
-def get_next_page_url(soup):
-    next_btn = soup.select_one('a.s-pagination-next:not(.s-pagination-disabled)')
-    if next_btn and next_btn.get('href'):
-        return 'https://www.amazon.com' + next_btn['href']
-    return None
+def get_product_links(page_data):
+    return [{'asin': p['asin'], 'url': p['url']} for p in page_data['products']]
 
 def scrape_category(start_url, max_pages=400, delay=2):
     url = start_url
@@ -41,15 +21,15 @@ def scrape_category(start_url, max_pages=400, delay=2):
         if resp.status_code != 200:
             print(f"Failed to fetch page: {resp.status_code}")
             break
-        soup = BeautifulSoup(resp.text, "html.parser")
-        products = get_product_links(soup)
+        page_data = parse_search_page(resp.text)
+        products = get_product_links(page_data)
         print(f"Found {len(products)} products.")
         for prod in products:
             key = (prod['asin'], prod['url'])
             if key not in seen:
                 all_products.append(prod)
                 seen.add(key)
-        next_url = get_next_page_url(soup)
+        next_url = page_data['next_url']
         if not next_url:
             print("No more pages.")
             break
@@ -1,6 +1,7 @@
 import requests
 from bs4 import BeautifulSoup
 import time
+from search_page import parse_search_page
 
 MAX_BATCH_SIZE = 10  # Allow up to 10 products per call for stability
 
@@ -23,16 +24,9 @@ def scrape_category_urls(category_urls, limit=100):
             }
             try:
                 resp = requests.get(url, headers=headers, timeout=15)
-                soup = BeautifulSoup(resp.text, "html.parser")
                 found = 0
-                for div in soup.select('div.s-result-item[data-asin]'):
-                    a = div.select_one('a[href*="/dp/"]')
-                    if not a:
-                        continue
-                    href = a.get('href').split('?')[0]
-                    if not href.startswith('http'):
-                        href = 'https://www.amazon.com' + href
-                    product_urls.append(href)
+                for product in parse_search_page(resp.text)["products"]:
+                    product_urls.append(product["url"])
                     found += 1
                     if len(product_urls) >= limit:
                         break
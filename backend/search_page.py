@@ -0,0 +1,119 @@
+"""
+Fast extractor for Amazon search/category results pages.
+
+Pulls result ASINs, the first /dp/ link of each result, a sponsored flag and
+the next-page URL in a single regex scan over the raw HTML, without building
+a BeautifulSoup tree. Produces the same products as
+soup.select('div.s-result-item[data-asin]') + select_one('a[href*="/dp/"]')
+and the same next link as 'a.s-pagination-next:not(.s-pagination-disabled)'.
+
+A result owns everything up to its matching </div>, found by counting div
+opens and closes; nested results are reported outer first, as bs4 does.
+A result is sponsored if its div or a div/a/span inside it has an AdHolder
+or sponsored-label class, or if its product link goes through /sspa/.
+"""
+import re
+from html import unescape
+
+AMAZON_BASE_URL = "https://www.amazon.com"
+
+# Comments, script/style bodies (skipped, like an HTML parser would), </div>
+# and the opening <div>/<a>/<span> tags we care about. Attribute values may
+# contain '>'.
+_TOKEN_RE = re.compile(
+    r"<(?:"
+    r"!--.*?-->"
+    r"|/(?P<close>div)\s*>"
+    r"|(?P<raw>script|style)\b.*?</(?P=raw)\s*>"
+    r"|(?P<tag>div|a|span)\b(?P<attrs>(?:\"[^\"]*\"|'[^']*'|[^'\">])*)>"
+    r")",
+    re.S | re.I,
+)
+_ATTR_RE = re.compile(
+    r"([^\s\"'=<>/]+)(?:\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'=<>`]+)))?"
+)
+_SPONSORED_MARKERS = ("s-sponsored-label", "puis-sponsored-label", "AdHolder")
+
+
+def _parse_attrs(attrs):
+    parsed = {}
+    for name, dq, sq, bare in _ATTR_RE.findall(attrs):
+        name = name.lower()
+        if name not in parsed:
+            value = dq or sq or bare
+            parsed[name] = unescape(value) if "&" in value else value
+    return parsed
+
+
+def _absolute_url(href):
+    if not href.startswith("http"):
+        return AMAZON_BASE_URL + href
+    return href
+
+
+def parse_search_page(html):
+    """
+    Extract products and the next-page URL from a search results page.
+    Returns {"products": [{"asin", "url", "sponsored"}, ...], "next_url": str or None}.
+    """
+    products = []
+    next_url = None
+    next_seen = False
+    depth = 0  # open <div> count
+    open_results = []  # (result, depth of its <div>), outermost first
+    for m in _TOKEN_RE.finditer(html):
+        if m.group("close"):
+            if depth:
+                depth -= 1
+                while open_results and open_results[-1][1] > depth:
+                    open_results.pop()
+            continue
+        tag = m.group("tag")
+        if tag is None:
+            continue
+        tag = tag.lower()
+        attrs_text = m.group("attrs")
+        if tag == "div":
+            if attrs_text.endswith("/"):
+                continue
+            depth += 1
+            if "data-asin" in attrs_text and "s-result-item" in attrs_text:
+                attrs = _parse_attrs(attrs_text)
+                if ("data-asin" in attrs
+                        and "s-result-item" in attrs.get("class", "").split()):
+                    result = {
+                        "asin": attrs["data-asin"],
+                        "url": None,
+                        "sponsored": False,
+                    }
+                    products.append(result)
+                    open_results.append((result, depth))
+        elif tag == "a":
+            if open_results and "/dp/" in attrs_text:
+                href = _parse_attrs(attrs_text).get("href", "")
+                if "/dp/" in href:
+                    url = _absolute_url(href.split("?")[0])
+                    for result, _ in open_results:
+                        if result["url"] is None:
+                            result["url"] = url
+                            if href.startswith("/sspa/"):
+                                result["sponsored"] = True
+            if not next_seen and "s-pagination-next" in attrs_text:
+                attrs = _parse_attrs(attrs_text)
+                classes = attrs.get("class", "").split()
+                if ("s-pagination-next" in classes
+                        and "s-pagination-disabled" not in classes):
+                    # Only the first Next link counts, even with an empty href.
+                    next_seen = True
+                    if attrs.get("href"):
+                        next_url = AMAZON_BASE_URL + attrs["href"]
+        if (open_results
+                and any(marker in attrs_text for marker in _SPONSORED_MARKERS)):
+            classes = _parse_attrs(attrs_text).get("class", "")
+            if any(marker in classes for marker in _SPONSORED_MARKERS):
+                for result, _ in open_results:
+                    result["sponsored"] = True
+    return {
+        "products": [p for p in products if p["url"] is not None],
+        "next_url": next_url,
+    }
@@ -0,0 +1,150 @@
+"""
+Benchmark: search results page parsing
+--------------------------------------
+Compares the BeautifulSoup extraction the scrapers used to do against
+backend/search_page.parse_search_page on saved results pages, and checks
+that both return the same products, sponsored flags and next-page URL,
+including on a set of boundary-case snippets.
+
+Usage:
+- Save a few category pages from the browser (Ctrl+S, "HTML only").
+- python bench_search_page.py page1.html page2.html ... [--repeat 20]
+- With no files, a synthetic 48-result page is used.
+"""
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from backend.search_page import parse_search_page
+
+
+SPONSORED_SELECTOR = ', '.join(
+    f'{tag}[class*="{marker}"]'
+    for tag in ('div', 'a', 'span')
+    for marker in ('s-sponsored-label', 'puis-sponsored-label', 'AdHolder')
+)
+
+# Boundary cases the synthetic page does not cover.
+EDGE_CASES = [
+    ("no link, /dp/ links after the result",
+     '<div class="s-result-item" data-asin="A1"><span>no link</span></div>'
+     '<div class="rhf"><a href="/x/dp/B999">history</a></div>'),
+    ("AdHolder after an organic result",
+     '<div class="s-result-item" data-asin="A1"><a href="/a/dp/A1">x</a></div>'
+     '<div class="AdHolder">footer ad</div>'),
+    ("nested results",
+     '<div class="s-result-item" data-asin="OUT"><div><a href="/o/dp/OUT">o</a></div>'
+     '<div class="s-result-item AdHolder" data-asin="IN"><a href="/i/dp/IN">i</a></div>'
+     '</div><a href="/after/dp/X">after</a>'),
+    ("sponsored label inside the result",
+     '<div class="s-result-item" data-asin="S1"><span class="puis-sponsored-label-text">Sponsored</span>'
+     '<a href="/s/dp/S1">s</a></div><div class="s-result-item" data-asin="O1"><a href="/o/dp/O1">o</a></div>'),
+    ("empty-href Next before a valid one",
+     '<a class="s-pagination-item s-pagination-next" href="">Next</a>'
+     '<a class="s-pagination-item s-pagination-next" href="/s?page=3">Next</a>'),
+    ("disabled Next link before a valid one",
+     '<a class="s-pagination-next s-pagination-disabled" href="/s?page=2">Next</a>'
+     '<a class="s-pagination-next" href="/s?page=3">Next</a>'),
+]
+
+
+def bs4_parse(html):
+    soup = BeautifulSoup(html, "html.parser")
+    products = []
+    for div in soup.select('div.s-result-item[data-asin]'):
+        a = div.select_one('a[href*="/dp/"]')
+        if not a:
+            continue
+        href = a.get('href')
+        url = href.split('?')[0]
+        if not url.startswith('http'):
+            url = 'https://www.amazon.com' + url
+        sponsored = bool(
+            'AdHolder' in div.get('class', [])
+            or div.select_one(SPONSORED_SELECTOR)
+            or href.startswith('/sspa/')
+        )
+        products.append((div.get('data-asin'), url, sponsored))
+    next_btn = soup.select_one('a.s-pagination-next:not(.s-pagination-disabled)')
+    next_url = None
+    if next_btn and next_btn.get('href'):
+        next_url = 'https://www.amazon.com' + next_btn['href']
+    return products, next_url
+
+
+def fast_parse(html):
+    page = parse_search_page(html)
+    return [(p['asin'], p['url'], p['sponsored']) for p in page['products']], page['next_url']
+
+
+def synthetic_page(results=48):
+    filler = '<div class="a-section"><span class="a-size-base">filler</span></div>' * 40
+    items = []
+    for i in range(results):
+        asin = f"B0{i:08d}"
+        if i % 8 == 0:
+            href = f"/Sponsored-Product/dp/{asin}/ref=sxin_1?sp_csd=x&amp;qid=1"
+            label = '<span class="puis-sponsored-label-text">Sponsored</span>'
+        else:
+            href = f"/Some-Product-Name/dp/{asin}/ref=sr_1_{i}?keywords=x&amp;qid=1"
+            label = ''
+        items.append(
+            f'<div data-asin="{asin}" data-index="{i}" class="sg-col-4-of-24 s-result-item s-asin">'
+            f'<script>var x = "<div class=\\"s-result-item\\" data-asin=\\"FAKE\\">";</script>'
+            f'{label}<a class="a-link-normal s-no-outline" href="{href}">'
+            f'<img src="https://m.media-amazon.com/images/I/{asin}.jpg" alt="x > y"></a>'
+            f'{filler}<a href="{href}"><h2><span>Product {i}</span></h2></a></div>'
+        )
+        items.append('<div data-asin="" class="s-result-item s-widget"><span>ad</span></div>')
+    head = '<html><head><script>' + 'var a = 1;' * 5000 + '</script></head><body>'
+    pagination = (
+        '<span class="s-pagination-item s-pagination-previous s-pagination-disabled">Previous</span>'
+        '<a href="/s?i=fashion&amp;page=2&amp;ref=sr_pg_1" '
+        'class="s-pagination-item s-pagination-next s-pagination-button">Next</a>'
+    )
+    return head + ''.join(items) + pagination + '</body></html>'
+
+
+def bench(func, html, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search results page parser benchmark")
+    parser.add_argument("files", nargs='*', help="Saved Amazon search results pages")
+    parser.add_argument("--repeat", type=int, default=10, help="Parses per page and parser")
+    args = parser.parse_args()
+
+    for name, html in EDGE_CASES:
+        expected = bs4_parse(html)
+        got = fast_parse(html)
+        if got == expected:
+            print(f"[OK] {name}")
+        else:
+            print(f"[MISMATCH] {name}: bs4={expected} fast={got}")
+
+    pages = []
+    for path in args.files:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append((path, f.read()))
+    if not pages:
+        pages.append(("<synthetic>", synthetic_page()))
+
+    for name, html in pages:
+        expected = bs4_parse(html)
+        got = fast_parse(html)
+        sponsored = sum(p[2] for p in got[0])
+        match = "OK" if got == expected else "MISMATCH"
+        slow = bench(bs4_parse, html, args.repeat)
+        fast = bench(fast_parse, html, args.repeat)
+        print(f"{name}: {len(html) // 1024} KiB, {len(got[0])} products ({sponsored} sponsored), next={'yes' if got[1] else 'no'} [{match}]")
+        print(f"  bs4:  {slow * 1000:8.2f} ms/page")
+        print(f"  fast: {fast * 1000:8.2f} ms/page  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()